@@ -3,8 +3,48 @@ Network calculation utilities for IP address and subnet analysis.
 Contains functions for network address calculation, CIDR conversion, and class identification.
 """
 
+import re
+import socket
+import struct
+import sys
+from typing import Dict, Optional, Tuple
 
-def ip_to_binary(ip_str):
+if sys.version_info >= (3, 10):
+    def _popcount(n: int) -> int:
+        return n.bit_count()
+else:
+    def _popcount(n: int) -> int:
+        return bin(n).count('1')
+
+
+def ip_to_int(ip_str: str) -> int:
+    """
+    Convert IP address string to a 32-bit unsigned integer.
+
+    Args:
+        ip_str: IP address in dotted decimal format (e.g., "192.168.1.1")
+
+    Returns:
+        IP address as integer (e.g., 3232235777)
+    """
+    ip_int: int = struct.unpack('!I', socket.inet_aton(ip_str))[0]
+    return ip_int
+
+
+def int_to_ip(ip_int: int) -> str:
+    """
+    Convert 32-bit unsigned integer to IP address string.
+
+    Args:
+        ip_int: IP address as integer
+
+    Returns:
+        IP address in dotted decimal format
+    """
+    return socket.inet_ntoa(struct.pack('!I', ip_int))
+
+
+def ip_to_binary(ip_str: str) -> str:
     """
     Convert IP address string to 32-bit binary string.
 
@@ -14,12 +54,14 @@ def ip_to_binary(ip_str):
     Returns:
         32-bit binary string
     """
-    octets = ip_str.split('.')
-    binary = ''.join([format(int(octet), '08b') for octet in octets])
-    return binary
+    return format(ip_to_int(ip_str), '032b')
+
+
+# Decimal string for every 8-bit binary octet string
+_DEC_FROM_BIN = {format(i, '08b'): str(i) for i in range(256)}
 
 
-def binary_to_ip(binary_str):
+def binary_to_ip(binary_str: str) -> str:
     """
     Convert 32-bit binary string to IP address string.
 
@@ -29,14 +71,17 @@ def binary_to_ip(binary_str):
     Returns:
         IP address in dotted decimal format
     """
-    octets = []
-    for i in range(0, 32, 8):
-        octet = binary_str[i:i+8]
-        octets.append(str(int(octet, 2)))
-    return '.'.join(octets)
+    return (f"{_DEC_FROM_BIN[binary_str[:8]]}.{_DEC_FROM_BIN[binary_str[8:16]]}."
+            f"{_DEC_FROM_BIN[binary_str[16:24]]}.{_DEC_FROM_BIN[binary_str[24:32]]}")
 
 
-def validate_ip(ip_str):
+# Exactly 4 plain decimal octets between 0-255, without leading zeros
+# (inet_aton rejects signs and whitespace, and reads leading zeros as octal)
+_OCTET = r'(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])'
+_IP_RE = re.compile(rf'{_OCTET}\.{_OCTET}\.{_OCTET}\.{_OCTET}')
+
+
+def validate_ip(ip_str: str) -> bool:
     """
     Validate IP address format and values.
 
@@ -46,25 +91,26 @@ def validate_ip(ip_str):
     Returns:
         True if valid, False otherwise
     """
-    parts = ip_str.split('.')
+    return _IP_RE.fullmatch(ip_str) is not None
 
-    # Check if exactly 4 octets
-    if len(parts) != 4:
-        return False
 
-    # Check if each octet is between 0-255
-    for part in parts:
-        try:
-            value = int(part)
-            if value < 0 or value > 255:
-                return False
-        except ValueError:
-            return False
+def _is_contiguous_mask(mask_int: int) -> bool:
+    """
+    Check that a 32-bit mask has contiguous 1s followed by contiguous 0s.
 
-    return True
+    Args:
+        mask_int: Subnet mask as integer
+
+    Returns:
+        True if contiguous, False otherwise
+    """
+    # The inverted host bits must be all trailing 1s, i.e. adding 1 to
+    # them clears every set bit
+    host_bits = ~mask_int & 0xFFFFFFFF
+    return host_bits & (host_bits + 1) == 0
 
 
-def validate_subnet_mask(mask_str):
+def validate_subnet_mask(mask_str: str) -> bool:
     """
     Validate subnet mask format and correctness.
     A valid subnet mask must have contiguous 1s followed by contiguous 0s.
@@ -78,21 +124,35 @@ def validate_subnet_mask(mask_str):
     if not validate_ip(mask_str):
         return False
 
-    # Convert to binary and check if it's a valid mask (contiguous 1s)
-    binary = ip_to_binary(mask_str)
+    return _is_contiguous_mask(ip_to_int(mask_str))
+
+
+def _net_addr(ip_int: int, mask_int: int) -> int:
+    """Network address of pre-parsed IP and mask integers."""
+    return ip_int & mask_int
+
 
-    # Check if mask is contiguous (no 0s before 1s)
-    found_zero = False
-    for bit in binary:
-        if bit == '0':
-            found_zero = True
-        elif found_zero and bit == '1':
-            return False
+def _bcast(ip_int: int, mask_int: int) -> int:
+    """Broadcast address of pre-parsed IP and mask integers."""
+    return (ip_int & mask_int) | (~mask_int & 0xFFFFFFFF)
 
-    return True
 
+def _cidr(mask_int: int) -> int:
+    """CIDR prefix length of a pre-parsed mask integer."""
+    return _popcount(mask_int)
 
-def get_network_address(ip_str, mask_str):
+
+def _hosts(mask_int: int) -> int:
+    """Number of usable hosts for a pre-parsed mask integer."""
+    host_bits = 32 - _cidr(mask_int)
+
+    # 2^host_bits - 2 (subtract network and broadcast addresses)
+    if host_bits == 0:
+        return 0
+    return (1 << host_bits) - 2
+
+
+def get_network_address(ip_str: str, mask_str: str) -> str:
     """
     Calculate network address by performing bitwise AND between IP and mask.
 
@@ -103,17 +163,10 @@ def get_network_address(ip_str, mask_str):
     Returns:
         Network address as string
     """
-    ip_binary = ip_to_binary(ip_str)
-    mask_binary = ip_to_binary(mask_str)
-
-    # Perform bitwise AND
-    network_binary = ''.join(['1' if ip_binary[i] == '1' and mask_binary[i] == '1' else '0'
-                              for i in range(32)])
-
-    return binary_to_ip(network_binary)
+    return int_to_ip(_net_addr(ip_to_int(ip_str), ip_to_int(mask_str)))
 
 
-def get_broadcast_address(ip_str, mask_str):
+def get_broadcast_address(ip_str: str, mask_str: str) -> str:
     """
     Calculate broadcast address.
     Broadcast = Network address OR (NOT mask)
@@ -125,18 +178,26 @@ def get_broadcast_address(ip_str, mask_str):
     Returns:
         Broadcast address as string
     """
-    network_addr = get_network_address(ip_str, mask_str)
-    network_binary = ip_to_binary(network_addr)
-    mask_binary = ip_to_binary(mask_str)
+    return int_to_ip(_bcast(ip_to_int(ip_str), ip_to_int(mask_str)))
+
+
+def get_network_and_broadcast(ip_str: str, mask_str: str) -> Tuple[str, str]:
+    """
+    Calculate network and broadcast addresses, parsing the IP and mask once.
 
-    # Perform OR with inverted mask
-    broadcast_binary = ''.join(['1' if mask_binary[i] == '0' else network_binary[i]
-                                for i in range(32)])
+    Args:
+        ip_str: IP address string
+        mask_str: Subnet mask string
 
-    return binary_to_ip(broadcast_binary)
+    Returns:
+        Tuple (network_addr, broadcast_addr) as strings
+    """
+    ip_int = ip_to_int(ip_str)
+    mask_int = ip_to_int(mask_str)
+    return int_to_ip(_net_addr(ip_int, mask_int)), int_to_ip(_bcast(ip_int, mask_int))
 
 
-def calculate_number_of_hosts(mask_str):
+def calculate_number_of_hosts(mask_str: str) -> int:
     """
     Calculate number of usable hosts in the subnet.
     Formula: 2^(host_bits) - 2
@@ -147,16 +208,10 @@ def calculate_number_of_hosts(mask_str):
     Returns:
         Number of usable hosts
     """
-    mask_binary = ip_to_binary(mask_str)
-    host_bits = mask_binary.count('0')
+    return _hosts(ip_to_int(mask_str))
 
-    # 2^host_bits - 2 (subtract network and broadcast addresses)
-    if host_bits == 0:
-        return 0
-    return (2 ** host_bits) - 2
 
-
-def get_cidr_notation(mask_str):
+def get_cidr_notation(mask_str: str) -> int:
     """
     Convert subnet mask to CIDR notation (number of network bits).
 
@@ -166,11 +221,27 @@ def get_cidr_notation(mask_str):
     Returns:
         CIDR prefix length as integer
     """
-    mask_binary = ip_to_binary(mask_str)
-    return mask_binary.count('1')
+    return _cidr(ip_to_int(mask_str))
+
 
+# Class letter code for every first octet value (0 = no class):
+# 0 | 1-126 A | 127 loopback | 128-191 B | 192-223 C | 224-255 D/E
+_CLASS_BY_OCTET = bytes([0] + [ord('A')] * 126 + [0] + [ord('B')] * 64 + [ord('C')] * 32 + [0] * 32)
 
-def get_ip_class(ip_str):
+_DEFAULT_CIDR: Dict[Optional[str], int] = {'A': 8, 'B': 16, 'C': 24}
+
+# Same tables keyed by class letter code, for the int path
+_DEFAULT_CIDR_BY_CODE: Dict[int, int] = {ord('A'): 8, ord('B'): 16, ord('C'): 24}
+_CLASS_NAME_BY_CODE: Dict[int, str] = {ord('A'): 'Class A', ord('B'): 'Class B', ord('C'): 'Class C'}
+
+
+def _ip_class(first_octet: int) -> Optional[str]:
+    """Class letter for a first octet value, or None."""
+    code = _CLASS_BY_OCTET[first_octet]
+    return chr(code) if code else None
+
+
+def get_ip_class(ip_str: str) -> Optional[str]:
     """
     Determine the class of an IP address based on first octet.
     Class A: 1-126 (first bit: 0)
@@ -183,19 +254,10 @@ def get_ip_class(ip_str):
     Returns:
         Class as string ('A', 'B', or 'C')
     """
-    first_octet = int(ip_str.split('.')[0])
+    return _ip_class(int(ip_str.split('.')[0]))
 
-    if 1 <= first_octet <= 126:
-        return 'A'
-    elif 128 <= first_octet <= 191:
-        return 'B'
-    elif 192 <= first_octet <= 223:
-        return 'C'
-    else:
-        return None
 
-
-def get_default_mask_cidr(ip_class):
+def get_default_mask_cidr(ip_class: Optional[str]) -> Optional[int]:
     """
     Get default CIDR notation for a given IP class.
 
@@ -205,16 +267,20 @@ def get_default_mask_cidr(ip_class):
     Returns:
         Default CIDR prefix length
     """
-    if ip_class == 'A':
-        return 8
-    elif ip_class == 'B':
-        return 16
-    elif ip_class == 'C':
-        return 24
-    return None
+    return _DEFAULT_CIDR.get(ip_class)
+
+
+def _is_classful(ip_int: int, mask_int: int) -> Tuple[bool, str]:
+    """is_classful() for pre-parsed IP and mask integers."""
+    code = _CLASS_BY_OCTET[ip_int >> 24]
+
+    if code and _popcount(mask_int) == _DEFAULT_CIDR_BY_CODE[code]:
+        return True, _CLASS_NAME_BY_CODE[code]
+    else:
+        return False, 'Classless'
 
 
-def is_classful(ip_str, mask_str):
+def is_classful(ip_str: str, mask_str: str) -> Tuple[bool, str]:
     """
     Determine if the network is classful or classless.
     Classful means the mask matches the default mask for the IP class.
@@ -228,15 +294,48 @@ def is_classful(ip_str, mask_str):
         - is_classful: True if classful, False if classless
         - class_name: 'Class A', 'Class B', 'Class C', or 'Classless'
     """
-    ip_class = get_ip_class(ip_str)
+    return _is_classful(ip_to_int(ip_str), ip_to_int(mask_str))
 
-    if ip_class is None:
-        return False, 'Classless'
 
-    cidr = get_cidr_notation(mask_str)
-    default_cidr = get_default_mask_cidr(ip_class)
+def _analyze(ip_int: int, mask_int: int) -> Tuple[int, int, int, int, str]:
+    """
+    Calculate all network parameters for pre-parsed IP and mask integers.
+    Fuses the _net_addr/_bcast/_hosts/_cidr/_is_classful helpers into one
+    call so the mask is only inverted and counted once.
+
+    Args:
+        ip_int: IP address as integer
+        mask_int: Subnet mask as integer
 
-    if cidr == default_cidr:
-        return True, f'Class {ip_class}'
+    Returns:
+        Tuple (network_int, broadcast_int, num_hosts, cidr, class_name)
+    """
+    network = ip_int & mask_int
+    cidr = _popcount(mask_int)
+    host_bits = 32 - cidr
+
+    # 2^host_bits - 2 (subtract network and broadcast addresses)
+    num_hosts = (1 << host_bits) - 2 if host_bits else 0
+
+    code = _CLASS_BY_OCTET[ip_int >> 24]
+    if code and cidr == _DEFAULT_CIDR_BY_CODE[code]:
+        class_name = _CLASS_NAME_BY_CODE[code]
     else:
-        return False, 'Classless'
+        class_name = 'Classless'
+
+    return network, network | (~mask_int & 0xFFFFFFFF), num_hosts, cidr, class_name
+
+
+def get_network_info(ip_str: str, mask_str: str) -> Tuple[str, str, int, int, str]:
+    """
+    Calculate all network parameters, parsing the IP and mask only once.
+
+    Args:
+        ip_str: IP address string
+        mask_str: Subnet mask string
+
+    Returns:
+        Tuple (network_addr, broadcast_addr, num_hosts, cidr, class_name)
+    """
+    network, broadcast, num_hosts, cidr, class_name = _analyze(ip_to_int(ip_str), ip_to_int(mask_str))
+    return int_to_ip(network), int_to_ip(broadcast), num_hosts, cidr, class_name
@@ -0,0 +1,92 @@
+"""
+Vectorized network calculations for analyzing many IP/mask pairs at once.
+Mirrors the functions in utils.py, operating on NumPy uint32 arrays.
+NumPy is only required for this module; the interactive tool does not use it.
+"""
+
+import socket
+
+from core.utils import _CLASS_BY_OCTET
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+else:
+    _CLASS_TABLE_NP = np.frombuffer(_CLASS_BY_OCTET, dtype=np.uint8)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for batch analysis (pip install numpy)")
+
+
+def ips_to_array(ip_strs):
+    """
+    Convert IP address strings to an array of 32-bit unsigned integers.
+
+    Args:
+        ip_strs: Iterable of IP addresses in dotted decimal format
+
+    Returns:
+        NumPy uint32 array
+    """
+    _require_numpy()
+    packed = b''.join(socket.inet_aton(ip_str) for ip_str in ip_strs)
+    return np.frombuffer(packed, dtype='>u4').astype(np.uint32)
+
+
+def array_to_ips(ip_array):
+    """
+    Convert an array of 32-bit unsigned integers to IP address strings.
+
+    Args:
+        ip_array: NumPy uint32 array
+
+    Returns:
+        List of IP addresses in dotted decimal format
+    """
+    _require_numpy()
+    packed = ip_array.astype('>u4').tobytes()
+    return [socket.inet_ntoa(packed[i:i+4]) for i in range(0, len(packed), 4)]
+
+
+def _popcount(values):
+    # Count set bits per uint32 by unpacking each into its 32 bits
+    bits = np.unpackbits(values.astype(np.uint32).view(np.uint8))
+    return bits.reshape(-1, 32).sum(axis=1)
+
+
+def _ip_class(ips):
+    # Gather class codes by first octet; code 0 becomes an empty string
+    codes = _CLASS_TABLE_NP[ips >> 24]
+    return codes.view('S1').astype('U1')
+
+
+def batch_analyze(ips, masks):
+    """
+    Calculate network parameters for arrays of IPs and subnet masks.
+
+    Args:
+        ips: NumPy uint32 array of IP addresses
+        masks: NumPy uint32 array of subnet masks (same length as ips)
+
+    Returns:
+        Tuple (network, broadcast, num_hosts, cidr, ip_class) of arrays
+        - network, broadcast: uint32 addresses
+        - num_hosts, cidr: integer counts
+        - ip_class: 'A', 'B', 'C', or '' when the IP has no class
+    """
+    _require_numpy()
+    ips = np.asarray(ips, dtype=np.uint32)
+    masks = np.asarray(masks, dtype=np.uint32)
+
+    network = np.bitwise_and(ips, masks)
+    broadcast = np.bitwise_or(network, np.invert(masks))
+    cidr = _popcount(masks)
+
+    # 2^host_bits - 2, computed in int64 since a /0 has 2^32 addresses
+    host_bits = 32 - cidr.astype(np.int64)
+    num_hosts = np.where(host_bits == 0, 0, np.left_shift(np.int64(1), host_bits) - 2)
+
+    return network, broadcast, num_hosts, cidr, _ip_class(ips)
@@ -5,20 +5,16 @@ It calculates network address, broadcast address, number of hosts, CIDR notation
 and determines if the network is classful or classless.
 """
 
-import sys
+import argparse
 import os
-
-# Add core directory to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), 'core'))
+import sys
+from pathlib import Path
 
 from core.utils import (
     validate_ip,
     validate_subnet_mask,
-    get_network_address,
-    get_broadcast_address,
-    calculate_number_of_hosts,
-    get_cidr_notation,
-    is_classful
+    get_default_mask_cidr,
+    get_network_info
 )
 
 from core.output_string import (
@@ -77,58 +73,132 @@ def generate_output_file(ip_str, mask_str, student_id="123456789"):
         ip_str: IP address string
         mask_str: Subnet mask string
         student_id: Student ID for filename (default: "123456789")
+
+    The file is written to the directory in the SUBNET_OUT environment
+    variable, or the current directory if it is not set.
     """
     # Calculate all network parameters
-    network_addr = get_network_address(ip_str, mask_str)
-    broadcast_addr = get_broadcast_address(ip_str, mask_str)
-    num_hosts = calculate_number_of_hosts(mask_str)
-    cidr = get_cidr_notation(mask_str)
-    classful, class_name = is_classful(ip_str, mask_str)
-
-    # Generate output lines using the provided functions
-    output_lines = [
-        format_input_ip(ip_str),
-        format_subnet_mask(mask_str),
-        format_classful_status(class_name),
-        format_network_address(network_addr),
-        format_broadcast_address(broadcast_addr),
-        format_num_hosts(num_hosts),
-        format_cidr_mask(cidr)
-    ]
-
-    # Create filename
-    filename = f"subnet_info_{ip_str}_{student_id}.txt"
-
-    # Write to file (functions already include newlines)
-    with open(filename, 'w') as f:
-        f.write(''.join(output_lines))
-
-    print(f"\nOutput file generated: {filename}")
-
-    # Also print to console
-    print("\n=== Network Analysis Results ===")
-    for line in output_lines:
-        print(line)
-    print("=" * 32)
-
-
-def main():
+    network_addr, broadcast_addr, num_hosts, cidr, class_name = get_network_info(ip_str, mask_str)
+
+    # Generate output using the provided functions (they already include newlines)
+    body = (
+        f"{format_input_ip(ip_str)}"
+        f"{format_subnet_mask(mask_str)}"
+        f"{format_classful_status(class_name)}"
+        f"{format_network_address(network_addr)}"
+        f"{format_broadcast_address(broadcast_addr)}"
+        f"{format_num_hosts(num_hosts)}"
+        f"{format_cidr_mask(cidr)}"
+    )
+
+    # Create filename inside the output directory (SUBNET_OUT, default: current directory)
+    filename = Path(os.environ.get('SUBNET_OUT', '.')) / f"subnet_info_{ip_str}_{student_id}.txt"
+
+    # Write to file in one buffered write
+    with filename.open('w', buffering=1 << 16) as f:
+        f.write(body)
+
+    # Also print to console, as a single write
+    sys.stdout.write(
+        f"\nOutput file generated: {filename}\n"
+        f"\n=== Network Analysis Results ===\n{body}{'=' * 32}\n"
+    )
+
+
+def run_batch(lines, out=None):
+    """
+    Analyze many "ip,mask" lines at once and write one CSV row per line.
+    Invalid lines are reported on stderr and skipped.
+
+    Args:
+        lines: Iterable of "ip,mask" strings (e.g., sys.stdin)
+        out: Stream to write the CSV rows to (default: sys.stdout)
+    """
+    # Imported here since the batch path is the only one that needs NumPy
+    from core.utils_batch import ips_to_array, array_to_ips, batch_analyze
+
+    ips = []
+    masks = []
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+
+        ip, _, mask = line.partition(',')
+        ip = ip.strip()
+        mask = mask.strip()
+
+        if not validate_ip(ip) or not validate_subnet_mask(mask):
+            print(f"Error: line {line_no}: invalid IP address or subnet mask: {line}", file=sys.stderr)
+            continue
+
+        ips.append(ip)
+        masks.append(mask)
+
+    network, broadcast, num_hosts, cidr, ip_class = batch_analyze(ips_to_array(ips), ips_to_array(masks))
+
+    rows = ["ip,mask,network,broadcast,hosts,cidr,class"]
+    for ip, mask, net, bcast, hosts, prefix, cls in zip(
+            ips, masks, array_to_ips(network), array_to_ips(broadcast), num_hosts, cidr, ip_class):
+        class_name = f"Class {cls}" if cls and prefix == get_default_mask_cidr(cls) else "Classless"
+        rows.append(f"{ip},{mask},{net},{bcast},{hosts},/{prefix},{class_name}")
+    (out or sys.stdout).write("\n".join(rows) + "\n")
+
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments.
+
+    Args:
+        argv: Argument list (default: sys.argv[1:])
+
+    Returns:
+        argparse.Namespace with ip, mask, student_id and stdin_batch
+    """
+    parser = argparse.ArgumentParser(description="Network Investigation Tool")
+    parser.add_argument('--ip', help="IP address (x.x.x.x); prompted for if omitted")
+    parser.add_argument('--mask', help="Subnet mask (x.x.x.x); prompted for if omitted")
+    parser.add_argument('--student-id', default="123456789",
+                        help="Student ID for the output filename (default: 123456789)")
+    parser.add_argument('--stdin-batch', action='store_true',
+                        help="Read \"ip,mask\" lines from stdin and print CSV results (requires NumPy)")
+    args = parser.parse_args(argv)
+
+    if args.ip is not None and not validate_ip(args.ip):
+        parser.error("invalid IP address. Please enter a valid IP in format x.x.x.x (0-255 for each octet)")
+    if args.mask is not None and not validate_subnet_mask(args.mask):
+        parser.error("invalid subnet mask. Mask must be x.x.x.x with contiguous 1s followed by 0s in binary.")
+
+    return args
+
+
+def main(argv=None):
     """
     Main function to run the network investigation tool.
+    Uses --ip/--mask when given and prompts for anything missing.
+
+    Args:
+        argv: Argument list (default: sys.argv[1:])
     """
+    args = parse_args(argv)
+
+    if args.stdin_batch:
+        try:
+            run_batch(sys.stdin)
+        except ImportError as e:
+            sys.exit(f"Error: {e}")
+        return
+
     print("=" * 50)
     print("Network Investigation Tool")
     print("=" * 50)
     print()
 
-    # Get valid IP and subnet mask from user
-    ip_address = get_valid_ip()
-    subnet_mask = get_valid_subnet_mask()
+    # Get valid IP and subnet mask from the arguments or the user
+    ip_address = args.ip if args.ip is not None else get_valid_ip()
+    subnet_mask = args.mask if args.mask is not None else get_valid_subnet_mask()
 
-    # Generate output file (use actual student ID here)
-    # For this example, using "123456789" - replace with actual ID
-    student_id = "123456789"
-    generate_output_file(ip_address, subnet_mask, student_id)
+    generate_output_file(ip_address, subnet_mask, args.student_id)
 
 
 if __name__ == "__main__":
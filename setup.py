@@ -0,0 +1,22 @@
+"""
+Optional build script that compiles core/utils.py to a C extension with mypyc.
+Compile in place with:  python setup.py build_ext --inplace
+Without mypyc installed (pip install mypy), the pure Python module is used.
+"""
+
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = mypycify(['core/utils.py'])
+
+setup(
+    name='network-tool',
+    version='1.0',
+    py_modules=['main'],
+    packages=['core'],
+    ext_modules=ext_modules
+)